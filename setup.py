@@ -1,44 +1,64 @@
+import functools
+import mmap
+import os
+
 from setuptools import setup, find_packages
 
-# Read requirements.txt
-with open("requirements.txt", "r") as f:
-    requirements = [line.strip() for line in f if line.strip() and not line.startswith("#")]
 
-setup(
-    name="finance-agent-system",
-    version="1.0.0",
-    packages=find_packages(where="src"),
-    package_dir={"": "src"},
-    install_requires=requirements,
-    author="Vedant Barbhaya",
-    author_email="vedant.barbhaya@example.com",
-    description="A multiagent finance system for data collection, analysis, and trading insights",
-    long_description=open("README.md").read(),
-    long_description_content_type="text/markdown",
-    url="https://github.com/vedantbarbhaya/Finance-Agent-System",
-    classifiers=[
-        "Development Status :: 4 - Beta",
-        "Intended Audience :: Financial and Insurance Industry",
-        "Intended Audience :: Developers",
-        "Topic :: Office/Business :: Financial :: Investment",
-        "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
-        "Programming Language :: Python :: 3.10",
-        "Programming Language :: Python :: 3.11",
-        "License :: OSI Approved :: MIT License",
-        "Operating System :: OS Independent",
-    ],
-    keywords="finance, trading, multiagent, AI, data collection, financial analysis",
-    python_requires=">=3.8",
-    entry_points={
-        "console_scripts": [
-            "finance-agent=src.main:main",
+def _read_long_desc():
+    with open("README.md", "rb") as fh:
+        # mmap cannot map an empty file
+        if os.fstat(fh.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm[:].decode("utf-8")
+
+
+@functools.lru_cache(maxsize=1)
+def _requirements():
+    with open("requirements.txt", encoding="utf-8") as fh:
+        return [line for line in (raw.strip() for raw in fh) if line and not line.startswith("#")]
+
+
+if __name__ == "__main__":
+    setup(
+        name="finance-agent-system",
+        version="1.0.0",
+        packages=find_packages(where="src"),
+        package_dir={"": "src"},
+        install_requires=_requirements(),
+        extras_require={
+            "uvloop": ['uvloop>=0.18; platform_system != "Windows"'],
+        },
+        author="Vedant Barbhaya",
+        author_email="vedant.barbhaya@example.com",
+        description="A multiagent finance system for data collection, analysis, and trading insights",
+        long_description=_read_long_desc(),
+        long_description_content_type="text/markdown",
+        url="https://github.com/vedantbarbhaya/Finance-Agent-System",
+        classifiers=[
+            "Development Status :: 4 - Beta",
+            "Intended Audience :: Financial and Insurance Industry",
+            "Intended Audience :: Developers",
+            "Topic :: Office/Business :: Financial :: Investment",
+            "Programming Language :: Python :: 3",
+            "Programming Language :: Python :: 3.8",
+            "Programming Language :: Python :: 3.9",
+            "Programming Language :: Python :: 3.10",
+            "Programming Language :: Python :: 3.11",
+            "License :: OSI Approved :: MIT License",
+            "Operating System :: OS Independent",
         ],
-    },
-    project_urls={
-        "Bug Reports": "https://github.com/vedantbarbhaya/Finance-Agent-System/issues",
-        "Source": "https://github.com/vedantbarbhaya/Finance-Agent-System",
-        "Documentation": "https://github.com/vedantbarbhaya/Finance-Agent-System/wiki",
-    },
-) 
\ No newline at end of file
+        keywords="finance, trading, multiagent, AI, data collection, financial analysis",
+        python_requires=">=3.8",
+        entry_points={
+            "console_scripts": [
+                "finance-agent=src.main:main",
+            ],
+        },
+        project_urls={
+            "Bug Reports": "https://github.com/vedantbarbhaya/Finance-Agent-System/issues",
+            "Source": "https://github.com/vedantbarbhaya/Finance-Agent-System",
+            "Documentation": "https://github.com/vedantbarbhaya/Finance-Agent-System/wiki",
+        },
+    ) 
\ No newline at end of file
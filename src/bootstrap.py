@@ -0,0 +1,21 @@
+"""
+Process bootstrap helpers for Finance Agent System.
+
+In multi-worker deployments, call ``preload()`` once in the parent process
+before workers are forked so the .env file is parsed a single time and the
+workers inherit the resulting environment. For example, in a gunicorn config
+used with ``preload_app = True``::
+
+    from src.bootstrap import preload
+    preload()
+
+or at the top of a uvicorn/ASGI startup module. If ``preload()`` is never
+called, the first ``Config()`` in each process loads the .env file instead.
+"""
+
+from .config import _ensure_dotenv
+
+
+def preload() -> None:
+    """Load environment variables from the .env file into ``os.environ`` once."""
+    _ensure_dotenv()
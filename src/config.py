@@ -6,11 +6,163 @@ for the multiagent finance system.
 """
 
 import os
-from typing import Optional, Dict, Any
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional, Dict, Any, FrozenSet, Iterable, Mapping
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+_DOTENV_LOADED = False
+_TRUTHY: FrozenSet[str] = frozenset({'true', '1', 'yes', 'on'})
+
+
+def _ensure_dotenv() -> None:
+    """
+    Load environment variables from the .env file at most once per interpreter.
+    
+    Skipped entirely when ENV_LOADED_EXTERNALLY=1, e.g. in production where
+    real environment variables are provided by the deployment.
+    """
+    global _DOTENV_LOADED
+    if not _DOTENV_LOADED:
+        if os.environ.get('ENV_LOADED_EXTERNALLY') != '1':
+            load_dotenv(override=False)
+        _DOTENV_LOADED = True
+
+
+@lru_cache(maxsize=None)
+def _getenv_cached(key: str, default: Optional[str]) -> Optional[str]:
+    """Resolve an environment variable once per process."""
+    _ensure_dotenv()
+    return os.environ.get(key, default)
+
+
+@lru_cache(maxsize=None)
+def _getenv_bool_cached(key: str, default: bool) -> bool:
+    """Resolve and parse a boolean environment variable once per process."""
+    value = _getenv_cached(key, str(default)).lower()
+    return value in _TRUTHY
+
+
+@lru_cache(maxsize=None)
+def _getenv_int_cached(key: str, default: int) -> int:
+    """Resolve and parse an integer environment variable once per process."""
+    try:
+        return int(_getenv_cached(key, str(default)))
+    except ValueError:
+        return default
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Immutable snapshot of every configuration value read from the environment."""
+    environment: str
+    debug: bool
+    log_level: str
+    finnhub_api_key: Optional[str]
+    openbb_token: Optional[str]
+    sec_api_key: Optional[str]
+    fmp_api_key: Optional[str]
+    reddit_client_id: Optional[str]
+    reddit_client_secret: Optional[str]
+    reddit_user_agent: str
+    twitter_bearer_token: Optional[str]
+    openai_api_key: Optional[str]
+    langsmith_api_key: Optional[str]
+    huggingface_api_key: Optional[str]
+    database_url: Optional[str]
+    mongodb_uri: Optional[str]
+    qdrant_cluster_key: Optional[str]
+    qdrant_url: Optional[str]
+    data_dir: str
+    cache_enabled: bool
+    cache_ttl: int
+    rate_limit_enabled: bool
+    max_requests_per_minute: int
+    smtp_server: Optional[str]
+    smtp_port: int
+    email_username: Optional[str]
+    email_password: Optional[str]
+    slack_webhook_url: Optional[str]
+    secret_key: Optional[str]
+    jwt_secret_key: Optional[str]
+    jwt_expiration_hours: int
+    http_proxy: Optional[str]
+    https_proxy: Optional[str]
+    ssl_verify_disabled: bool
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """Read all configuration values from the environment."""
+        return cls(
+            environment=_getenv_cached('ENVIRONMENT', 'development'),
+            debug=_getenv_bool_cached('DEBUG', False),
+            log_level=_getenv_cached('LOG_LEVEL', 'INFO'),
+            finnhub_api_key=_getenv_cached('FINNHUB_API_KEY', None),
+            openbb_token=_getenv_cached('OPENBB_PAT', None),
+            sec_api_key=_getenv_cached('SEC_API_KEY', None),
+            fmp_api_key=_getenv_cached('FMP_API_KEY', None),
+            reddit_client_id=_getenv_cached('REDDIT_CLIENT_ID', None),
+            reddit_client_secret=_getenv_cached('REDDIT_CLIENT_SECRET', None),
+            reddit_user_agent=_getenv_cached('REDDIT_USER_AGENT', 'Finance-Agent-System/1.0'),
+            twitter_bearer_token=_getenv_cached('TWITTER_BEARER_TOKEN', None),
+            openai_api_key=_getenv_cached('OPENAI_API_KEY', None),
+            langsmith_api_key=_getenv_cached('LANGSMITH_API_KEY', None),
+            huggingface_api_key=_getenv_cached('HUGGINGFACE_API_KEY', None),
+            database_url=_getenv_cached('DATABASE_URL', None),
+            mongodb_uri=_getenv_cached('MONGODB_URI', None),
+            qdrant_cluster_key=_getenv_cached('QDRANT_CLUSTER_KEY', None),
+            qdrant_url=_getenv_cached('QDRANT_URL', None),
+            data_dir=_getenv_cached('DATA_DIR', './output'),
+            cache_enabled=_getenv_bool_cached('CACHE_ENABLED', True),
+            cache_ttl=_getenv_int_cached('CACHE_TTL', 3600),
+            rate_limit_enabled=_getenv_bool_cached('RATE_LIMIT_ENABLED', True),
+            max_requests_per_minute=_getenv_int_cached('MAX_REQUESTS_PER_MINUTE', 60),
+            smtp_server=_getenv_cached('SMTP_SERVER', None),
+            smtp_port=_getenv_int_cached('SMTP_PORT', 587),
+            email_username=_getenv_cached('EMAIL_USERNAME', None),
+            email_password=_getenv_cached('EMAIL_PASSWORD', None),
+            slack_webhook_url=_getenv_cached('SLACK_WEBHOOK_URL', None),
+            secret_key=_getenv_cached('SECRET_KEY', None),
+            jwt_secret_key=_getenv_cached('JWT_SECRET_KEY', None),
+            jwt_expiration_hours=_getenv_int_cached('JWT_EXPIRATION_HOURS', 24),
+            http_proxy=_getenv_cached('HTTP_PROXY', None),
+            https_proxy=_getenv_cached('HTTPS_PROXY', None),
+            ssl_verify_disabled=_getenv_bool_cached('DISABLE_SSL_VERIFY', False),
+        )
+
+
+_SETTINGS: Optional[Settings] = None
+
+
+def _get_settings() -> Settings:
+    """Return the process-wide settings snapshot, building it on first use."""
+    global _SETTINGS
+    if _SETTINGS is None:
+        _SETTINGS = Settings.from_env()
+    return _SETTINGS
+
+
+_ALL_CONFIG: Optional[Mapping[str, Any]] = None
+
+
+def _get_all_config() -> Mapping[str, Any]:
+    """Return the non-sensitive configuration view, building it on first use."""
+    global _ALL_CONFIG
+    if _ALL_CONFIG is None:
+        settings = _get_settings()
+        _ALL_CONFIG = MappingProxyType({
+            'environment': settings.environment,
+            'debug': settings.debug,
+            'log_level': settings.log_level,
+            'data_dir': settings.data_dir,
+            'cache_enabled': settings.cache_enabled,
+            'cache_ttl': settings.cache_ttl,
+            'rate_limit_enabled': settings.rate_limit_enabled,
+            'max_requests_per_minute': settings.max_requests_per_minute,
+            'ssl_verify_disabled': settings.ssl_verify_disabled,
+        })
+    return _ALL_CONFIG
 
 
 class Config:
@@ -18,9 +170,38 @@ class Config:
     
     def __init__(self):
         """Initialize configuration with default values."""
-        self.environment = self.get_env_variable('ENVIRONMENT', 'development')
-        self.debug = self.get_env_variable('DEBUG', 'false').lower() == 'true'
-        self.log_level = self.get_env_variable('LOG_LEVEL', 'INFO')
+        _ensure_dotenv()
+    
+    @property
+    def settings(self) -> Settings:
+        """Current settings snapshot, rebuilt after ``reload_env()``."""
+        return _get_settings()
+    
+    @property
+    def environment(self) -> str:
+        """Deployment environment name."""
+        return _get_settings().environment
+    
+    @property
+    def debug(self) -> bool:
+        """Whether debug mode is enabled."""
+        return _get_settings().debug
+    
+    @property
+    def log_level(self) -> str:
+        """Logging level name."""
+        return _get_settings().log_level
+    
+    def __getattr__(self, name: str) -> Any:
+        """Expose settings fields as attributes, e.g. ``config.finnhub_api_key``."""
+        if name in Settings.__dataclass_fields__:
+            return getattr(_get_settings(), name)
+        raise AttributeError(f"'Config' object has no attribute '{name}'")
+    
+    @property
+    def all_config(self) -> Mapping[str, Any]:
+        """Read-only view of all non-sensitive configuration values."""
+        return _get_all_config()
         
     @staticmethod
     def get_env_variable(key: str, default: Optional[str] = None) -> Optional[str]:
@@ -34,7 +215,7 @@ class Config:
         Returns:
             The value of the environment variable or the default value
         """
-        return os.getenv(key, default)
+        return _getenv_cached(key, default)
     
     @staticmethod
     def get_bool_env_variable(key: str, default: bool = False) -> bool:
@@ -48,8 +229,7 @@ class Config:
         Returns:
             Boolean value of the environment variable
         """
-        value = os.getenv(key, str(default)).lower()
-        return value in ('true', '1', 'yes', 'on')
+        return _getenv_bool_cached(key, default)
     
     @staticmethod
     def get_int_env_variable(key: str, default: int = 0) -> int:
@@ -63,204 +243,203 @@ class Config:
         Returns:
             Integer value of the environment variable
         """
-        try:
-            return int(os.getenv(key, str(default)))
-        except ValueError:
-            return default
+        return _getenv_int_cached(key, default)
+    
+    @staticmethod
+    def reload_env() -> None:
+        """
+        Discard cached environment lookups.
+        
+        Environment variables are resolved once per process; call this after
+        changing ``os.environ`` (e.g. in tests) so the new values are picked up.
+        """
+        global _SETTINGS, _ALL_CONFIG
+        _getenv_cached.cache_clear()
+        _getenv_bool_cached.cache_clear()
+        _getenv_int_cached.cache_clear()
+        _SETTINGS = None
+        _ALL_CONFIG = None
     
     # Financial Data API Keys
     @staticmethod
     def get_finnhub_api_key() -> Optional[str]:
         """Get Finnhub API key."""
-        return Config.get_env_variable('FINNHUB_API_KEY')
+        return _get_settings().finnhub_api_key
     
     @staticmethod
     def get_openbb_token() -> Optional[str]:
         """Get OpenBB platform token."""
-        return Config.get_env_variable('OPENBB_PAT')
+        return _get_settings().openbb_token
     
     @staticmethod
     def get_sec_api_key() -> Optional[str]:
         """Get SEC API key."""
-        return Config.get_env_variable('SEC_API_KEY')
+        return _get_settings().sec_api_key
     
     @staticmethod
     def get_fmp_api_key() -> Optional[str]:
         """Get Financial Modeling Prep API key."""
-        return Config.get_env_variable('FMP_API_KEY')
+        return _get_settings().fmp_api_key
     
     # Social Media API Keys
     @staticmethod
     def get_reddit_client_id() -> Optional[str]:
         """Get Reddit client ID."""
-        return Config.get_env_variable('REDDIT_CLIENT_ID')
+        return _get_settings().reddit_client_id
     
     @staticmethod
     def get_reddit_client_secret() -> Optional[str]:
         """Get Reddit client secret."""
-        return Config.get_env_variable('REDDIT_CLIENT_SECRET')
+        return _get_settings().reddit_client_secret
     
     @staticmethod
     def get_reddit_user_agent() -> str:
         """Get Reddit user agent."""
-        return Config.get_env_variable('REDDIT_USER_AGENT', 'Finance-Agent-System/1.0')
+        return _get_settings().reddit_user_agent
     
     @staticmethod
     def get_twitter_bearer_token() -> Optional[str]:
         """Get Twitter bearer token."""
-        return Config.get_env_variable('TWITTER_BEARER_TOKEN')
+        return _get_settings().twitter_bearer_token
     
     # AI/ML API Keys
     @staticmethod
     def get_openai_api_key() -> Optional[str]:
         """Get OpenAI API key."""
-        return Config.get_env_variable('OPENAI_API_KEY')
+        return _get_settings().openai_api_key
     
     @staticmethod
     def get_langsmith_api_key() -> Optional[str]:
         """Get LangSmith API key."""
-        return Config.get_env_variable('LANGSMITH_API_KEY')
+        return _get_settings().langsmith_api_key
     
     @staticmethod
     def get_huggingface_api_key() -> Optional[str]:
         """Get Hugging Face API key."""
-        return Config.get_env_variable('HUGGINGFACE_API_KEY')
+        return _get_settings().huggingface_api_key
     
     # Database Configuration
     @staticmethod
     def get_database_url() -> Optional[str]:
         """Get database URL."""
-        return Config.get_env_variable('DATABASE_URL')
+        return _get_settings().database_url
     
     @staticmethod
     def get_mongodb_uri() -> Optional[str]:
         """Get MongoDB URI."""
-        return Config.get_env_variable('MONGODB_URI')
+        return _get_settings().mongodb_uri
     
     @staticmethod
     def get_qdrant_cluster_key() -> Optional[str]:
         """Get Qdrant cluster key."""
-        return Config.get_env_variable('QDRANT_CLUSTER_KEY')
+        return _get_settings().qdrant_cluster_key
     
     @staticmethod
     def get_qdrant_url() -> Optional[str]:
         """Get Qdrant URL."""
-        return Config.get_env_variable('QDRANT_URL')
+        return _get_settings().qdrant_url
     
     # Application Settings
     @staticmethod
     def get_data_dir() -> str:
         """Get data directory path."""
-        return Config.get_env_variable('DATA_DIR', './output')
+        return _get_settings().data_dir
     
     @staticmethod
     def is_cache_enabled() -> bool:
         """Check if caching is enabled."""
-        return Config.get_bool_env_variable('CACHE_ENABLED', True)
+        return _get_settings().cache_enabled
     
     @staticmethod
     def get_cache_ttl() -> int:
         """Get cache TTL in seconds."""
-        return Config.get_int_env_variable('CACHE_TTL', 3600)
+        return _get_settings().cache_ttl
     
     @staticmethod
     def is_rate_limit_enabled() -> bool:
         """Check if rate limiting is enabled."""
-        return Config.get_bool_env_variable('RATE_LIMIT_ENABLED', True)
+        return _get_settings().rate_limit_enabled
     
     @staticmethod
     def get_max_requests_per_minute() -> int:
         """Get maximum requests per minute."""
-        return Config.get_int_env_variable('MAX_REQUESTS_PER_MINUTE', 60)
+        return _get_settings().max_requests_per_minute
     
     # Notification Settings
     @staticmethod
     def get_smtp_server() -> Optional[str]:
         """Get SMTP server."""
-        return Config.get_env_variable('SMTP_SERVER')
+        return _get_settings().smtp_server
     
     @staticmethod
     def get_smtp_port() -> int:
         """Get SMTP port."""
-        return Config.get_int_env_variable('SMTP_PORT', 587)
+        return _get_settings().smtp_port
     
     @staticmethod
     def get_email_username() -> Optional[str]:
         """Get email username."""
-        return Config.get_env_variable('EMAIL_USERNAME')
+        return _get_settings().email_username
     
     @staticmethod
     def get_email_password() -> Optional[str]:
         """Get email password."""
-        return Config.get_env_variable('EMAIL_PASSWORD')
+        return _get_settings().email_password
     
     @staticmethod
     def get_slack_webhook_url() -> Optional[str]:
         """Get Slack webhook URL."""
-        return Config.get_env_variable('SLACK_WEBHOOK_URL')
+        return _get_settings().slack_webhook_url
     
     # Security Settings
     @staticmethod
     def get_secret_key() -> Optional[str]:
         """Get secret key."""
-        return Config.get_env_variable('SECRET_KEY')
+        return _get_settings().secret_key
     
     @staticmethod
     def get_jwt_secret_key() -> Optional[str]:
         """Get JWT secret key."""
-        return Config.get_env_variable('JWT_SECRET_KEY')
+        return _get_settings().jwt_secret_key
     
     @staticmethod
     def get_jwt_expiration_hours() -> int:
         """Get JWT expiration hours."""
-        return Config.get_int_env_variable('JWT_EXPIRATION_HOURS', 24)
+        return _get_settings().jwt_expiration_hours
     
     # Proxy Settings
     @staticmethod
     def get_http_proxy() -> Optional[str]:
         """Get HTTP proxy."""
-        return Config.get_env_variable('HTTP_PROXY')
+        return _get_settings().http_proxy
     
     @staticmethod
     def get_https_proxy() -> Optional[str]:
         """Get HTTPS proxy."""
-        return Config.get_env_variable('HTTPS_PROXY')
+        return _get_settings().https_proxy
     
     @staticmethod
     def is_ssl_verify_disabled() -> bool:
         """Check if SSL verification is disabled."""
-        return Config.get_bool_env_variable('DISABLE_SSL_VERIFY', False)
+        return _get_settings().ssl_verify_disabled
     
     def get_all_config(self) -> Dict[str, Any]:
         """
         Get all configuration as a dictionary (excluding sensitive data).
         
         Returns:
-            Dictionary with all non-sensitive configuration values
+            Copy of ``all_config`` with all non-sensitive configuration values
         """
-        return {
-            'environment': self.environment,
-            'debug': self.debug,
-            'log_level': self.log_level,
-            'data_dir': self.get_data_dir(),
-            'cache_enabled': self.is_cache_enabled(),
-            'cache_ttl': self.get_cache_ttl(),
-            'rate_limit_enabled': self.is_rate_limit_enabled(),
-            'max_requests_per_minute': self.get_max_requests_per_minute(),
-            'ssl_verify_disabled': self.is_ssl_verify_disabled(),
-        }
-    
-    def validate_required_keys(self, required_keys: list) -> Dict[str, bool]:
+        return dict(self.all_config)
+    
+    def validate_required_keys(self, required_keys: Iterable[str]) -> Dict[str, bool]:
         """
         Validate that required API keys are present.
         
         Args:
-            required_keys: List of required environment variable names
+            required_keys: Tuple (or any iterable) of required environment variable names
             
         Returns:
             Dictionary mapping key names to whether they are present
         """
-        validation_results = {}
-        for key in required_keys:
-            validation_results[key] = bool(self.get_env_variable(key))
-        return validation_results 
\ No newline at end of file
+        return {key: bool(self.get_env_variable(key)) for key in required_keys} 
\ No newline at end of file
@@ -7,30 +7,53 @@ to collect, analyze, and provide insights on financial data from multiple source
 """
 
 import asyncio
+import functools
 import logging
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional, Set, Tuple, TypeVar
 
-# Add src to path for imports
-sys.path.append(str(Path(__file__).parent))
+from .bootstrap import preload
+from .config import Config
 
-from config import Config
-from Agents.DatacollectionAgent import DataCollectionAgent
-from data_sources.finnlp_utils import FinNLPUtils
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('finance_agent.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+if TYPE_CHECKING:
+    from .Agents.DatacollectionAgent import DataCollectionAgent
+    from .data_sources.finnlp_utils import FinNLPUtils
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar('T')
+
+_REQUIRED_KEYS: Tuple[str, ...] = ('FINNHUB_API_KEY',)
+
+# Output directories already created in this process
+_READY_OUTPUT_DIRS: Set[str] = set()
+
+
+def _setup_logging() -> None:
+    """Configure logging; the log file is only opened on the first record."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler('finance_agent.log', delay=True),
+            logging.StreamHandler(sys.stdout)
+        ]
+    )
+
+
+def _ensure_output_dir(path: str = "output") -> None:
+    """Create an output directory, touching the filesystem once per path."""
+    if path not in _READY_OUTPUT_DIRS:
+        Path(path).mkdir(parents=True, exist_ok=True)
+        _READY_OUTPUT_DIRS.add(path)
+
+
+async def _to_thread(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking call in the default executor (asyncio.to_thread needs 3.9+)."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
 
 class FinanceAgentSystem:
     """Main Finance Agent System orchestrator."""
@@ -38,44 +61,40 @@ class FinanceAgentSystem:
     def __init__(self):
         """Initialize the Finance Agent System."""
         self.config = Config()
-        self.data_collection_agent: Optional[DataCollectionAgent] = None
-        self.finnlp_utils: Optional[FinNLPUtils] = None
+        self.data_collection_agent: Optional["DataCollectionAgent"] = None
+        self.finnlp_utils: Optional["FinNLPUtils"] = None
         
         # Validate required API keys
         self._validate_configuration()
         
     def _validate_configuration(self) -> None:
         """Validate that required API keys are present."""
-        required_keys = ['FINNHUB_API_KEY']
-        missing_keys = []
-        
-        for key in required_keys:
-            if not self.config.get_env_variable(key):
-                missing_keys.append(key)
+        missing_keys = tuple(
+            key for key in _REQUIRED_KEYS if not self.config.get_env_variable(key)
+        )
         
         if missing_keys:
-            logger.warning(f"Missing API keys: {missing_keys}")
+            logger.warning("Missing API keys: %s", missing_keys)
             logger.warning("Some features may not work without proper API keys.")
             logger.info("Please check your .env file and add the missing keys.")
     
     def initialize_agents(self) -> None:
         """Initialize all agents."""
-        try:
-            # Initialize Data Collection Agent
-            finnhub_key = self.config.get_env_variable('FINNHUB_API_KEY')
-            if finnhub_key:
-                self.data_collection_agent = DataCollectionAgent(finnhub_key)
-                logger.info("Data Collection Agent initialized successfully")
-            else:
-                logger.warning("Data Collection Agent not initialized - missing FINNHUB_API_KEY")
-            
-            # Initialize FinNLP utilities
-            self.finnlp_utils = FinNLPUtils()
-            logger.info("FinNLP utilities initialized successfully")
-            
-        except Exception as e:
-            logger.error(f"Error initializing agents: {e}")
-            raise
+        # Initialize Data Collection Agent
+        finnhub_key = self.config.get_env_variable('FINNHUB_API_KEY')
+        if finnhub_key:
+            # Agent modules pull in pandas, yfinance and FinNLP, so they are
+            # imported here rather than at module level to keep startup fast.
+            from .Agents.DatacollectionAgent import DataCollectionAgent
+            self.data_collection_agent = DataCollectionAgent(finnhub_key)
+            logger.info("Data Collection Agent initialized successfully")
+        else:
+            logger.warning("Data Collection Agent not initialized - missing FINNHUB_API_KEY")
+        
+        # Initialize FinNLP utilities
+        from .data_sources.finnlp_utils import FinNLPUtils
+        self.finnlp_utils = FinNLPUtils()
+        logger.info("FinNLP utilities initialized successfully")
     
     async def run_data_collection_demo(self) -> None:
         """Run a demonstration of data collection capabilities."""
@@ -85,7 +104,8 @@ class FinanceAgentSystem:
             if self.data_collection_agent:
                 # Fetch sample stock data
                 logger.info("Fetching AAPL stock data...")
-                stock_data = self.data_collection_agent.fetch_data(
+                stock_data = await _to_thread(
+                    self.data_collection_agent.fetch_data,
                     symbol="AAPL",
                     source="yfinance",
                     start_date="2024-01-01",
@@ -93,9 +113,10 @@ class FinanceAgentSystem:
                 )
                 
                 if stock_data is not None and not stock_data.empty:
-                    logger.info(f"Successfully fetched {len(stock_data)} records for AAPL")
-                    logger.info(f"Data columns: {list(stock_data.columns)}")
-                    logger.info(f"Date range: {stock_data.index.min()} to {stock_data.index.max()}")
+                    logger.info("Successfully fetched %d records for AAPL", len(stock_data))
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info("Data columns: %s", list(stock_data.columns))
+                        logger.info("Date range: %s to %s", stock_data.index.min(), stock_data.index.max())
                 else:
                     logger.warning("No stock data retrieved")
             
@@ -103,23 +124,24 @@ class FinanceAgentSystem:
                 # Collect news data
                 logger.info("Collecting news data...")
                 try:
-                    news_data = self.finnlp_utils.cnbc_news_download(
+                    news_data = await _to_thread(
+                        self.finnlp_utils.cnbc_news_download,
                         keyword="AAPL",
                         rounds=1,
-                        save_path="output/aapl_news_demo.csv"
+                        save_path=str(Path(self.config.get_data_dir()) / "aapl_news_demo.csv")
                     )
                     
                     if not news_data.empty:
-                        logger.info(f"Successfully collected {len(news_data)} news articles")
+                        logger.info("Successfully collected %d news articles", len(news_data))
                     else:
                         logger.warning("No news data collected")
                         
                 except Exception as e:
-                    logger.error(f"Error collecting news data: {e}")
+                    logger.error("Error collecting news data: %s", e)
                     logger.info("This might be due to network issues or API limitations")
         
         except Exception as e:
-            logger.error(f"Error in data collection demo: {e}")
+            logger.error("Error in data collection demo: %s", e)
     
     async def run_sentiment_analysis_demo(self) -> None:
         """Run a demonstration of sentiment analysis capabilities."""
@@ -128,7 +150,8 @@ class FinanceAgentSystem:
         try:
             if self.data_collection_agent:
                 # Perform sentiment analysis
-                result = self.data_collection_agent.execute_task(
+                result = await _to_thread(
+                    self.data_collection_agent.execute_task,
                     query="What is the sentiment of recent stock performance?",
                     symbol="AAPL",
                     source="yfinance",
@@ -137,13 +160,13 @@ class FinanceAgentSystem:
                 )
                 
                 logger.info("Sentiment analysis completed")
-                logger.info(f"Result type: {type(result)}")
+                logger.info("Result type: %s", type(result))
                 
                 if hasattr(result, 'shape'):
-                    logger.info(f"Result shape: {result.shape}")
+                    logger.info("Result shape: %s", result.shape)
         
         except Exception as e:
-            logger.error(f"Error in sentiment analysis demo: {e}")
+            logger.error("Error in sentiment analysis demo: %s", e)
     
     async def run(self) -> None:
         """Run the main Finance Agent System."""
@@ -154,28 +177,29 @@ class FinanceAgentSystem:
             self.initialize_agents()
             
             # Create output directory
-            Path("output").mkdir(exist_ok=True)
+            _ensure_output_dir(self.config.get_data_dir())
             
-            # Run demonstrations
-            await self.run_data_collection_demo()
-            await self.run_sentiment_analysis_demo()
+            # Run demonstrations concurrently; each demo handles its own errors
+            await asyncio.gather(
+                self.run_data_collection_demo(),
+                self.run_sentiment_analysis_demo(),
+            )
             
             logger.info("✅ Finance Agent System completed successfully!")
             
         except KeyboardInterrupt:
             logger.info("System interrupted by user")
-        except Exception as e:
-            logger.error(f"System error: {e}")
-            raise
 
 
 async def main() -> None:
     """Main entry point for the Finance Agent System."""
+    preload()
+    _setup_logging()
     try:
         system = FinanceAgentSystem()
         await system.run()
-    except Exception as e:
-        logger.error(f"Fatal error: {e}")
+    except Exception:
+        logger.exception("Fatal error")
         sys.exit(1)
 
 
@@ -186,4 +210,10 @@ if __name__ == "__main__":
     print("for data collection and analysis")
     print("=" * 50)
     
-    asyncio.run(main()) 
\ No newline at end of file
+    # Prefer uvloop's faster event loop when it is installed
+    try:
+        from uvloop import run as _run
+    except ImportError:
+        _run = asyncio.run
+    
+    _run(main()) 
\ No newline at end of file
@@ -0,0 +1,77 @@
+import os
+import unittest
+from unittest import mock
+
+from src import config as config_module
+from src.config import Config
+
+
+class TestConfig(unittest.TestCase):
+    def setUp(self):
+        # Isolate each test from the real environment and any local .env file
+        env_patcher = mock.patch.dict(os.environ, clear=True)
+        env_patcher.start()
+        self.addCleanup(env_patcher.stop)
+        dotenv_patcher = mock.patch.object(config_module, '_DOTENV_LOADED', True)
+        dotenv_patcher.start()
+        self.addCleanup(dotenv_patcher.stop)
+        Config.reload_env()
+        self.addCleanup(Config.reload_env)
+
+    def test_lookups_are_cached(self):
+        os.environ['FINNHUB_API_KEY'] = 'first'
+        self.assertEqual(Config.get_env_variable('FINNHUB_API_KEY'), 'first')
+        os.environ['FINNHUB_API_KEY'] = 'second'
+        self.assertEqual(Config.get_env_variable('FINNHUB_API_KEY'), 'first')
+        self.assertEqual(Config.get_finnhub_api_key(), 'first')
+
+    def test_reload_env_updates_new_and_existing_instances(self):
+        existing = Config()
+        self.assertIsNone(existing.finnhub_api_key)
+        os.environ['FINNHUB_API_KEY'] = 'k'
+        os.environ['CACHE_TTL'] = '120'
+        Config.reload_env()
+        for config in (existing, Config()):
+            self.assertEqual(config.finnhub_api_key, 'k')
+            self.assertEqual(config.get_finnhub_api_key(), 'k')
+            self.assertEqual(config.get_env_variable('FINNHUB_API_KEY'), 'k')
+            self.assertEqual(config.all_config['cache_ttl'], 120)
+            self.assertEqual(config.get_all_config()['cache_ttl'], 120)
+
+    def test_invalid_int_falls_back_to_default(self):
+        os.environ['CACHE_TTL'] = 'not-a-number'
+        self.assertEqual(Config.get_cache_ttl(), 3600)
+        self.assertEqual(Config.get_int_env_variable('CACHE_TTL', 10), 10)
+
+    def test_debug_accepts_truthy_values(self):
+        for value in ('yes', '1', 'TRUE', 'on'):
+            with self.subTest(value=value):
+                os.environ['DEBUG'] = value
+                Config.reload_env()
+                self.assertTrue(Config().debug)
+        os.environ['DEBUG'] = 'no'
+        Config.reload_env()
+        self.assertFalse(Config().debug)
+
+    def test_unknown_attribute_names_config(self):
+        with self.assertRaisesRegex(AttributeError, "'Config' object"):
+            Config().nonexistent
+
+    def test_env_loaded_externally_skips_dotenv(self):
+        os.environ['ENV_LOADED_EXTERNALLY'] = '1'
+        with mock.patch.object(config_module, '_DOTENV_LOADED', False), \
+                mock.patch.object(config_module, 'load_dotenv') as load_dotenv:
+            Config()
+            load_dotenv.assert_not_called()
+
+    def test_dotenv_loaded_once(self):
+        with mock.patch.object(config_module, '_DOTENV_LOADED', False), \
+                mock.patch.object(config_module, 'load_dotenv') as load_dotenv:
+            Config()
+            Config()
+            Config.get_env_variable('FINNHUB_API_KEY')
+            load_dotenv.assert_called_once_with(override=False)
+
+
+if __name__ == '__main__':
+    unittest.main()